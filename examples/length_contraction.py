@@ -5,9 +5,18 @@ This example demonstrates length contraction by showing multiple rods
 of the same proper length moving at different velocities.
 """
 
+import matplotlib
+
+if __name__ == "__main__":
+    # Select Agg before the library imports pyplot
+    matplotlib.use("Agg")
+
 from special_relativity_grapher import Simulation
-from special_relativity_grapher.visualization import RelatavisticAnimation
-from special_relativity_grapher.utils import trueCond
+from special_relativity_grapher.visualization import RelatavisticAnimation, saveGif
+
+# Plot bounds (xmin, xmax, ymin, ymax)
+PLOT_LIMITS = (-5, 10, -2, 3)
+PLOT_LIMITS_TRANSVERSE = (-5, 10, -2, 7)
 
 
 def length_contraction_demo():
@@ -35,19 +44,17 @@ def length_contraction_demo():
     # Rod 3: Moving at -0.5c (opposite direction)
     LCsim.addLine([0, 2], proper_length, [0, 0], [0.5, 0], True, 0)
 
-    # Run simulation in ground frame
-    LCtimes_ground, LCoutput_ground = LCsim.runSimulation([0, 0], 0.1, 0, 10, trueCond)
-    
-    # Run simulation in frame moving at 0.5c
-    LCtimes_moving, LCoutput_moving = LCsim.runSimulation([0.5, 0], 0.1, 0, 10, trueCond)
+    # Build the worldlines once, then view them from the ground frame and
+    # a frame moving at 0.5c in a single pass
+    LCsim.precomputeWorldlines(0.1, 0, 10)
+    (LCtimes_ground, LCoutput_ground), (LCtimes_moving, LCoutput_moving) = \
+        LCsim.runSimulationsFromCache([[0, 0], [0.5, 0]])
 
     # Create animations
-    plot_limits = [-5, 10, -2, 3]
-    
-    ani_ground = RelatavisticAnimation([LCoutput_ground], plot_limits,
+    ani_ground = RelatavisticAnimation([LCoutput_ground], PLOT_LIMITS,
                                      "Length Contraction: Ground Frame")
     
-    ani_moving = RelatavisticAnimation([LCoutput_moving], plot_limits,
+    ani_moving = RelatavisticAnimation([LCoutput_moving], PLOT_LIMITS,
                                      "Length Contraction: Frame Moving at 0.5c")
     
     return ani_ground, ani_moving
@@ -73,11 +80,10 @@ def transverse_length_demo():
     LCsim.addLine([1, 0], 5, [0, 0], [-0.5, 0], False, 0)
 
     # Run simulation in ground frame
-    LCtimes, LCoutput = LCsim.runSimulation([0, 0], 0.1, 0, 10, trueCond)
+    LCtimes, LCoutput = LCsim.runSimulation([0, 0], 0.1, 0, 10, None)
 
     # Create animation
-    plot_limits = [-5, 10, -2, 7]
-    ani = RelatavisticAnimation([LCoutput], plot_limits,
+    ani = RelatavisticAnimation([LCoutput], PLOT_LIMITS_TRANSVERSE,
                               "No Transverse Length Contraction")
     
     return ani
@@ -93,6 +99,9 @@ if __name__ == "__main__":
     print("Running transverse length demo...")
     transverse_ani = transverse_length_demo()
     
-    print("Animations created. Use .save() to export as gif files.")
+    print("Saving gifs to the current directory...")
+    saveGif(ground_ani, 'length_contraction_ground.gif')
+    saveGif(moving_ani, 'length_contraction_moving.gif')
+    saveGif(transverse_ani, 'transverse_length.gif')
     print("Note: The rod moving at 0.99c will appear significantly contracted!")
     print("The contracted length = proper_length * sqrt(1 - v²/c²)")
@@ -5,9 +5,24 @@ This example demonstrates the famous pole-in-barn paradox, showing how
 the resolution depends on the relativity of simultaneity.
 """
 
+import matplotlib
+
+if __name__ == "__main__":
+    # Select Agg before the library imports pyplot
+    matplotlib.use("Agg")
+
 from special_relativity_grapher import Simulation
-from special_relativity_grapher.visualization import RelatavisticAnimation
-from special_relativity_grapher.utils import trueCond
+from special_relativity_grapher.visualization import RelatavisticAnimation, saveGif
+import numpy as np
+
+# Velocities shared by every object in the demo
+AT_REST = np.array([0.0, 0.0])
+POLE_VELO = np.array([-0.85, 0.0])
+DOOR_VELO = np.array([0.0, -0.95])
+
+# Plot bounds (xmin, xmax, ymin, ymax)
+PLOT_LIMITS_GROUND = (-15, 15, -5, 5)
+PLOT_LIMITS_POLE = (-20, 15, -5, 5)
 
 
 def pole_in_barn_demo():
@@ -25,37 +40,34 @@ def pole_in_barn_demo():
     PoleInBarnSim = Simulation()
     
     # Add person carrying the pole
-    PoleInBarnSim.addPerson([-10, 0], [0, 0], [-0.85, 0], 0.8, 0)
+    PoleInBarnSim.addPerson([-10, 0], AT_REST, POLE_VELO, 0.8, 0)
     
     # Add the pole (proper length = 6 units)
-    PoleInBarnSim.addLine([-13, 0], 6, [0, 0], [-0.85, 0], True, 0)
+    PoleInBarnSim.addLine([-13, 0], 6, AT_REST, POLE_VELO, True, 0)
     
     # Add barn structure (proper length = 6 units)
     # Bottom wall
-    PoleInBarnSim.addLine([-3, -1], 6, [0, 0], [0, 0], True, 0)
+    PoleInBarnSim.addLine([-3, -1], 6, AT_REST, AT_REST, True, 0)
     # Top wall  
-    PoleInBarnSim.addLine([-3, 1], 6, [0, 0], [0, 0], True, 0)
+    PoleInBarnSim.addLine([-3, 1], 6, AT_REST, AT_REST, True, 0)
     
     # Add barn doors (initially open, then close)
     # Left door
-    PoleInBarnSim.addLine([-3, 5], 2, [0, -0.95], [0, 0], False, 0)
+    PoleInBarnSim.addLine([-3, 5], 2, DOOR_VELO, AT_REST, False, 0)
     # Right door
-    PoleInBarnSim.addLine([3, 5], 2, [0, -0.95], [0, 0], False, 0)
+    PoleInBarnSim.addLine([3, 5], 2, DOOR_VELO, AT_REST, False, 0)
 
-    # Run simulation in ground frame
-    _, ground_output = PoleInBarnSim.runSimulation([0, 0], 0.1, -10, 30, trueCond)
-    
-    # Run simulation in pole frame  
-    _, pole_output = PoleInBarnSim.runSimulation([-0.85, 0], 0.1, -10, 30, trueCond)
+    # Build the worldlines once, then view them from the ground frame and
+    # the pole frame in a single pass
+    PoleInBarnSim.precomputeWorldlines(0.1, -10, 30)
+    (_, ground_output), (_, pole_output) = \
+        PoleInBarnSim.runSimulationsFromCache([AT_REST, POLE_VELO])
 
     # Create animations
-    plot_limits_ground = [-15, 15, -5, 5]
-    plot_limits_pole = [-20, 15, -5, 5]
-    
-    ani_ground = RelatavisticAnimation([ground_output], plot_limits_ground,
+    ani_ground = RelatavisticAnimation([ground_output], PLOT_LIMITS_GROUND,
                                      "Pole-in-Barn: Ground Frame (Pole fits!)")
     
-    ani_pole = RelatavisticAnimation([pole_output], plot_limits_pole,
+    ani_pole = RelatavisticAnimation([pole_output], PLOT_LIMITS_POLE,
                                    "Pole-in-Barn: Pole Frame (Doors not simultaneous!)")
     
     return ani_ground, ani_pole
@@ -107,4 +119,7 @@ if __name__ == "__main__":
     print("Animations created!")
     print("- Ground frame: Shows the pole fitting in the barn")
     print("- Pole frame: Shows non-simultaneous door closing")
-    print("Use .save() to export as gif files.")
+    
+    print("Saving gifs to the current directory...")
+    saveGif(ground_ani, 'pole_in_barn_ground.gif')
+    saveGif(pole_ani, 'pole_in_barn_pole.gif')
@@ -5,9 +5,18 @@ This example demonstrates the relativity of simultaneity - events that are
 simultaneous in one reference frame are not simultaneous in another.
 """
 
+import matplotlib
+
+if __name__ == "__main__":
+    # Select Agg before the library imports pyplot
+    matplotlib.use("Agg")
+
 from special_relativity_grapher import Simulation
-from special_relativity_grapher.visualization import RelatavisticAnimation
-from special_relativity_grapher.utils import trueCond
+from special_relativity_grapher.visualization import RelatavisticAnimation, saveGif
+
+# Plot bounds (xmin, xmax, ymin, ymax)
+PLOT_LIMITS = (-5, 10, -2, 2)
+PLOT_LIMITS_DIAG = (-5, 10, -5, 5)
 
 
 def simultaneity_demo():
@@ -30,26 +39,22 @@ def simultaneity_demo():
     # Add a train to show the reference frame
     LoSSim.addTrain([-1, -1], 7, 2, [0, 0], [0, 0], 0)
 
-    # Run simulation in ground frame (events are simultaneous)
-    _, ground_output = LoSSim.runSimulation([0, 0], 0.1, 0, 10, trueCond)
-    
-    # Run simulation in frame moving at 0.5c in x-direction
-    _, moving_x_output = LoSSim.runSimulation([0.5, 0], 0.1, 0, 10, trueCond)
-    
-    # Run simulation in frame moving diagonally (both x and y)
-    _, moving_diag_output = LoSSim.runSimulation([0.5, 0.5], 0.1, 0, 10, trueCond)
+    # Build the worldlines once, then view them from all three frames at once:
+    # the ground frame (events are simultaneous), a frame moving at 0.5c in
+    # the x-direction, and a frame moving diagonally (both x and y)
+    LoSSim.precomputeWorldlines(0.1, 0, 10)
+    frames = [[0, 0], [0.5, 0], [0.5, 0.5]]
+    (_, ground_output), (_, moving_x_output), (_, moving_diag_output) = \
+        LoSSim.runSimulationsFromCache(frames)
 
     # Create animations
-    plot_limits = [-5, 10, -2, 2]
-    plot_limits_diag = [-5, 10, -5, 5]
-    
-    ani_ground = RelatavisticAnimation([ground_output], plot_limits,
+    ani_ground = RelatavisticAnimation([ground_output], PLOT_LIMITS,
                                      "Simultaneity: Ground Frame (Events simultaneous)")
     
-    ani_moving_x = RelatavisticAnimation([moving_x_output], plot_limits,
+    ani_moving_x = RelatavisticAnimation([moving_x_output], PLOT_LIMITS,
                                        "Simultaneity: Frame moving at 0.5c in x")
     
-    ani_moving_diag = RelatavisticAnimation([moving_diag_output], plot_limits_diag,
+    ani_moving_diag = RelatavisticAnimation([moving_diag_output], PLOT_LIMITS_DIAG,
                                           "Simultaneity: Frame moving diagonally at 0.5c")
     
     return ani_ground, ani_moving_x, ani_moving_diag
@@ -109,4 +114,8 @@ if __name__ == "__main__":
     print("- Moving x frame: Events are no longer simultaneous")  
     print("- Moving diagonal frame: Shows effect persists even with y-component")
     print("Notice how the right event happens first in the moving frames!")
-    print("Use .save() to export as gif files.")
+    
+    print("Saving gifs to the current directory...")
+    saveGif(ground_ani, 'simultaneity_ground.gif')
+    saveGif(moving_x_ani, 'simultaneity_moving_x.gif')
+    saveGif(moving_diag_ani, 'simultaneity_moving_diag.gif')
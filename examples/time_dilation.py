@@ -6,12 +6,19 @@ that pulses at regular intervals. The pulse rate appears different when viewed
 from different reference frames.
 """
 
+import matplotlib
+
+if __name__ == "__main__":
+    # Select Agg before the library imports pyplot
+    matplotlib.use("Agg")
+
 from special_relativity_grapher import Simulation
-from special_relativity_grapher.visualization import RelatavisticAnimation
-from special_relativity_grapher.utils import trueCond
-from IPython.display import HTML
+from special_relativity_grapher.visualization import RelatavisticAnimation, saveGif
 import numpy as np
 
+# Plot bounds (xmin, xmax, ymin, ymax)
+PLOT_LIMITS = (-20, 20, -5, 5)
+
 
 def time_dilation_demo():
     """
@@ -32,19 +39,17 @@ def time_dilation_demo():
     TDsim.addPulse(pt, 3, 5, 15, frame_velo)
     TDsim.addTrain([-1, -1], 2, 2, [0, 0], frame_velo, 0)
 
-    # Run simulation in train frame (moving with the train)
-    TDtimes_train, TDout_train = TDsim.runSimulation(frame_velo, 0.1, 0, 20, trueCond)
-    
-    # Run simulation in ground frame (stationary)
-    TDtimes_ground, TDout_ground = TDsim.runSimulation([0, 0], 0.1, 0, 20, trueCond)
+    # Build the worldlines once, then view them from the train frame (moving
+    # with the train) and the ground frame (stationary) in a single pass
+    TDsim.precomputeWorldlines(0.1, 0, 20)
+    (TDtimes_train, TDout_train), (TDtimes_ground, TDout_ground) = \
+        TDsim.runSimulationsFromCache([frame_velo, [0, 0]])
 
     # Create animations
-    plot_limits = [-20, 20, -5, 5]
-    
-    ani_train = RelatavisticAnimation([TDout_train], plot_limits, 
+    ani_train = RelatavisticAnimation([TDout_train], PLOT_LIMITS, 
                                     "Time Dilation: Train Frame (Clock appears normal)")
     
-    ani_ground = RelatavisticAnimation([TDout_ground], plot_limits,
+    ani_ground = RelatavisticAnimation([TDout_ground], PLOT_LIMITS,
                                      "Time Dilation: Ground Frame (Clock appears slow)")
     
     return ani_train, ani_ground
@@ -67,7 +72,7 @@ def light_clock_demo():
     TDsim_train.addLightBounce(pt, 0.1, 0, 12, frame_velo)
     TDsim_train.addTrain([-1, -1], 2, 2, [0, 0], frame_velo, 0)
 
-    TDtimes_train, TDout_train = TDsim_train.runSimulationLight([0.0, 0.0], 0.1, 0, 12, trueCond)
+    TDtimes_train, TDout_train = TDsim_train.runSimulationLight([0.0, 0.0], 0.1, 0, 12, None)
     
     # Ground frame simulation
     TDsim_ground = Simulation()
@@ -76,14 +81,12 @@ def light_clock_demo():
     TDsim_ground.addLightBounce(pt, 0.1, 0, 20, frame_velo)
     TDsim_ground.addTrain([-1, -1], 2, 2, [0, 0], frame_velo, 0)
 
-    TDtimes_ground, TDout_ground = TDsim_ground.runSimulationLight([0.8, 0.0], 0.1, 0, 20, trueCond)
+    TDtimes_ground, TDout_ground = TDsim_ground.runSimulationLight([0.8, 0.0], 0.1, 0, 20, None)
 
-    plot_limits = [-20, 20, -5, 5]
-    
-    ani_train = RelatavisticAnimation([TDout_train], plot_limits,
+    ani_train = RelatavisticAnimation([TDout_train], PLOT_LIMITS,
                                     "Light Clock: Train Frame")
     
-    ani_ground = RelatavisticAnimation([TDout_ground], plot_limits,
+    ani_ground = RelatavisticAnimation([TDout_ground], PLOT_LIMITS,
                                      "Light Clock: Ground Frame (Time Dilated)")
     
     return ani_train, ani_ground
@@ -99,5 +102,8 @@ if __name__ == "__main__":
     print("Running light clock demo...")
     light_train_ani, light_ground_ani = light_clock_demo()
     
-    print("Animations created. Use .save() to export as gif files.")
-    print("Example: train_ani.save('time_dilation_train.gif', writer='pillow', fps=30)")
+    print("Saving gifs to the current directory...")
+    saveGif(train_ani, 'time_dilation_train.gif')
+    saveGif(ground_ani, 'time_dilation_ground.gif')
+    saveGif(light_train_ani, 'light_clock_train.gif')
+    saveGif(light_ground_ani, 'light_clock_ground.gif')
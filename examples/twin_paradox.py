@@ -5,9 +5,15 @@ This example demonstrates the twin paradox, showing why the traveling twin
 ages less than the Earth-bound twin.
 """
 
+import matplotlib
+
+if __name__ == "__main__":
+    # Select Agg before the library imports pyplot
+    matplotlib.use("Agg")
+
 from special_relativity_grapher import Simulation
-from special_relativity_grapher.visualization import RelatavisticAnimation
-from special_relativity_grapher.utils import trueCond
+from special_relativity_grapher.visualization import RelatavisticAnimation, saveGif
+from math import sqrt
 import numpy as np
 
 
@@ -25,7 +31,7 @@ def twin_paradox_demo():
     # Parameters
     D = 8  # Distance to target in light-years
     speed_of_rocket = 0.8  # Velocity as fraction of c
-    gamma_rocket = 1 / np.sqrt(1 - speed_of_rocket**2)  # Lorentz factor
+    gamma_rocket = 1.0 / sqrt(1 - speed_of_rocket**2)  # Lorentz factor
     L = D / speed_of_rocket * 2  # Total trip time in ground frame
 
     # Simulation 1: Signals sent by Earth twin
@@ -35,8 +41,9 @@ def twin_paradox_demo():
     TwinParadoxSim1.addPt([0.0, 0.0, 0.0], [0, 1], [0, 0])
     
     # Earth twin sends signals every time unit
-    for i in range(int(L)):
-        TwinParadoxSim1.addLine([0, i+1], 0.01, [1, 1], [0, 0], True, i+1)
+    ts = np.arange(1, int(L) + 1)
+    xs = np.zeros_like(ts)
+    TwinParadoxSim1.addLines(np.stack([xs, ts], axis=1), 0.01, [1, 1], [0, 0], True, ts)
 
     # Moving twin's path (out and back)
     TwinParadoxSim1.addPt([0.0, D, L/2], [0, 0], [0, 0])  # Target planet
@@ -51,11 +58,14 @@ def twin_paradox_demo():
     
     # Traveling twin sends fewer signals due to time dilation
     iter_count = int(L / gamma_rocket) + 1
-    for i in range(iter_count):
-        # Signals sent at dilated rate
-        time_coord = (i + 1) * gamma_rocket
-        x_coord = speed_of_rocket * (-abs(-iter_count/2 + i + 1) + iter_count/2)
-        TwinParadoxSim2.addLine([x_coord, time_coord], 0.01, [-1, 1], [0, 0], True, time_coord)
+    i = np.arange(iter_count)
+    # Signals sent at dilated rate
+    time_coord = (i + 1) * gamma_rocket
+    # Distance travelled rises to the turnaround at iter_count/2, then falls back
+    ramp = iter_count/2 - np.abs(i + 1 - iter_count/2)
+    x_coord = speed_of_rocket * ramp
+    TwinParadoxSim2.addLines(np.stack([x_coord, time_coord], axis=1), 0.01, [-1, 1], [0, 0],
+                             True, time_coord)
 
     # Moving twin's path (same as before)
     TwinParadoxSim2.addPt([0.0, D, L/2], [0, 0], [0, 0])  # Target planet
@@ -63,8 +73,8 @@ def twin_paradox_demo():
     TwinParadoxSim2.addLine([D, L/2], 0.01, [-speed_of_rocket, 1], [0, 0], True, L/2)  # Return
 
     # Run simulations in ground frame
-    _, earth_signals = TwinParadoxSim1.runSimulation([0, 0.0], 0.1, 0, L, trueCond)
-    _, spaceship_signals = TwinParadoxSim2.runSimulation([0, 0.0], 0.1, 0, L, trueCond)
+    _, earth_signals = TwinParadoxSim1.runSimulation([0, 0.0], 0.1, 0, L, None)
+    _, spaceship_signals = TwinParadoxSim2.runSimulation([0, 0.0], 0.1, 0, L, None)
 
     # Create animations
     plot_limits = [-1, D+1, -1, L+1]
@@ -131,4 +141,7 @@ if __name__ == "__main__":
     print("- Earth signals: Shows many signals sent by stationary twin")
     print("- Spaceship signals: Shows fewer signals sent by traveling twin")
     print("The difference in signal count shows the age difference!")
-    print("Use .save() to export as gif files.")
+    
+    print("Saving gifs to the current directory...")
+    saveGif(earth_ani, 'twin_paradox_earth.gif')
+    saveGif(spaceship_ani, 'twin_paradox_spaceship.gif')
@@ -15,13 +15,15 @@ from .simulation import Simulation
 from .transforms import (
     getGamma,
     lorentzTranformPt,
+    lorentzBoostMatrix,
     addVelocities,
     lorentzTransformObject,
     getEOM
 )
 from .visualization import (
     Minkowski,
-    RelatavisticAnimation
+    RelatavisticAnimation,
+    saveGif
 )
 from .utils import (
     trueCond,
@@ -33,11 +35,13 @@ __all__ = [
     "Simulation",
     "getGamma",
     "lorentzTranformPt", 
+    "lorentzBoostMatrix",
     "addVelocities",
     "lorentzTransformObject",
     "getEOM",
     "Minkowski",
     "RelatavisticAnimation",
+    "saveGif",
     "trueCond",
     "stopAtTime", 
     "stopAtEvent"
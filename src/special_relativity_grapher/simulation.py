@@ -6,7 +6,7 @@ and reference frames for relativistic physics simulations.
 """
 
 import numpy as np
-from .transforms import addVelocities, lorentzTranformPt, getEOM
+from .transforms import addVelocities, lorentzBoostMatrix
 
 
 class Simulation:
@@ -27,6 +27,7 @@ class Simulation:
         self.frameVelocity = []
         self.events = []
         self.eventVelos = []
+        self.worldlineCache = None
         # Adding the origin to the simulation when we initialize
         self.objects.append([[0,0,0]])
         self.velocieis.append([0,0])
@@ -79,6 +80,31 @@ class Simulation:
         self.velocieis.append(velocity)
         self.frameVelocity.append(frameVelo)
 
+    def addLines(self, startPts, L, velocity, frameVelo, doX, ts):
+        """
+        Add several line segments sharing the same length and velocities.
+
+        Equivalent to calling addLine once per start point, but builds all
+        endpoints as one array and extends the object lists in a single pass.
+
+        Args:
+            startPts (array-like): Starting points, shape (N, 2) of [x, y]
+            L (float): Length of every line
+            velocity (list): Line velocity [vx, vy] in its frame
+            frameVelo (list): Velocity [vx, vy] of the lines' frame relative to ground
+            doX (bool): If True, lines extend in X direction; if False, in Y direction
+            ts (array-like): Time coordinate for each line, shape (N,), or one
+                time shared by all lines
+        """
+        startPts = np.asarray(startPts, dtype=float).reshape(-1, 2)
+        lines = np.empty((len(startPts), 2, 3))
+        lines[:, :, 0] = np.broadcast_to(ts, len(startPts))[:, None]
+        lines[:, :, 1:] = startPts[:, None, :]
+        lines[:, 1, 1 if doX else 2] += L
+        self.objects.extend(lines.tolist())
+        self.velocieis.extend([velocity] * len(lines))
+        self.frameVelocity.extend([frameVelo] * len(lines))
+
     def addTrain(self, bottomLeft, L, H, velocity, frameVelo, t):
         """
         Add a rectangular train/box to the simulation.
@@ -175,7 +201,7 @@ class Simulation:
             self.eventVelos.append(frameVelo)
             y = y + direction * dT
 
-    def runSimulation(self, frameVelocity, dT, Ts, Tend, condition):
+    def runSimulation(self, frameVelocity, dT, Ts, Tend, condition=None):
         """
         Run the simulation in a given reference frame.
         
@@ -187,46 +213,16 @@ class Simulation:
             dT (float): Time step size
             Ts (float): Start time
             Tend (float): End time
-            condition (function): Function that takes time and returns bool to continue
+            condition (function): Function that takes time and returns bool to continue,
+                or None to run until Tend without calling a condition
             
         Returns:
             tuple: (times, objects) where objects[t][i][j][pos] gives position data
         """
-        newEvents = []
-        objectEOMS = []
-        for i in range(len(self.events)):
-            relVel = addVelocities([0,0], self.eventVelos[i], frameVelocity)
-            newEvents.append(lorentzTranformPt(self.events[i], relVel))
-        for i in range(len(self.objects)):
-            EOM = getEOM(self.objects[i], self.velocieis[i],
-                        self.frameVelocity[i], frameVelocity)
-            objectEOMS.append(EOM)
+        times = self._sampleTimes(dT, Ts, Tend, condition)
+        return self._runFrames(self._snapshot(), times, 10 * dT, [frameVelocity])[0]
 
-        times = []
-        objects = []
-        currentT = Ts
-        while currentT < Tend and condition(currentT):
-            times.append(currentT)
-            timeStepObjects = []
-            for EOM in objectEOMS:
-                currentObject = []
-                for pt in EOM:
-                    Xpos = pt[0][0] * currentT + pt[0][1]
-                    Ypos = pt[1][0] * currentT + pt[1][1]
-                    vec = [Xpos, Ypos]
-                    currentObject.append(vec)
-                timeStepObjects.append(currentObject)
-
-            for event in newEvents:
-                if np.abs(event[0] - currentT) < 10 * dT:
-                    timeStepObjects.append([[event[1], event[2]]])
-
-            objects.append(timeStepObjects)
-            currentT = currentT + dT
-
-        return times, objects
-
-    def runSimulationLight(self, frameVelocity, dT, Ts, Tend, condition):
+    def runSimulationLight(self, frameVelocity, dT, Ts, Tend, condition=None):
         """
         Run simulation with different event timing for light bouncing.
         
@@ -237,41 +233,173 @@ class Simulation:
             dT (float): Time step size
             Ts (float): Start time
             Tend (float): End time
-            condition (function): Function that takes time and returns bool to continue
+            condition (function): Function that takes time and returns bool to continue,
+                or None to run until Tend without calling a condition
             
         Returns:
             tuple: (times, objects) where objects[t][i][j][pos] gives position data
         """
-        newEvents = []
-        objectEOMS = []
-        for i in range(len(self.events)):
-            relVel = addVelocities([0,0], self.eventVelos[i], frameVelocity)
-            newEvents.append(lorentzTranformPt(self.events[i], relVel))
-        for i in range(len(self.objects)):
-            EOM = getEOM(self.objects[i], self.velocieis[i],
-                        self.frameVelocity[i], frameVelocity)
-            objectEOMS.append(EOM)
+        times = self._sampleTimes(dT, Ts, Tend, condition)
+        return self._runFrames(self._snapshot(), times, 0.8 * dT, [frameVelocity])[0]
+
+    def precomputeWorldlines(self, dT, Ts, Tend):
+        """
+        Cache the frame-independent part of a simulation run.
+
+        Every object point is stored as two events in its own frame: its
+        starting 4-vector and the same point one time unit later. Together
+        with the frame velocities, the events and the sample times, this is all
+        runSimulationFromCache needs to replay the simulation in any observation
+        frame without rebuilding the objects. Everything is copied, so objects
+        or events added afterwards only show up after calling it again.
+
+        Args:
+            dT (float): Time step size
+            Ts (float): Start time
+            Tend (float): End time
+
+        Returns:
+            numpy.ndarray: Array of shape (N_pts, 2, 3) holding the two [t, x, y]
+            events of every object point, in the point's own frame
+        """
+        self.worldlineCache = self._snapshot()
+        self.worldlineCache["times"] = self._sampleTimes(dT, Ts, Tend, None)
+        self.worldlineCache["dT"] = dT
+        return self.worldlineCache["worldlines"]
+
+    def runSimulationFromCache(self, frameVelocity, condition=None):
+        """
+        Run the simulation in a given reference frame using cached worldlines.
+
+        Produces the same output as runSimulation, but reuses the worldlines
+        from precomputeWorldlines. All event pairs are boosted in a single
+        batched matrix multiply and positions are sampled for all times at once.
+
+        Args:
+            frameVelocity (list): Velocity [vx, vy] of the observation frame
+            condition (function): Function that takes time and returns bool to continue,
+                or None to run until the cached end time
 
+        Returns:
+            tuple: (times, objects) where objects[t][i][j][pos] gives position data
+        """
+        return self.runSimulationsFromCache([frameVelocity], condition)[0]
+
+    def runSimulationsFromCache(self, frameVelocities, condition=None):
+        """
+        Run the simulation in several reference frames using cached worldlines.
+
+        The boosts for every frame are stacked and applied to the cached
+        worldlines in one einsum, so viewing the same objects from several
+        frames costs little more than viewing them from one.
+
+        Args:
+            frameVelocities (list): Velocities [vx, vy] of the observation frames
+            condition (function): Function that takes time and returns bool to continue,
+                or None to run until the cached end time
+
+        Returns:
+            list: One (times, objects) tuple per frame, as from runSimulationFromCache
+        """
+        if self.worldlineCache is None:
+            raise RuntimeError("Call precomputeWorldlines before runSimulationFromCache")
+        cache = self.worldlineCache
+        times = cache["times"]
+        if condition is not None:
+            # Stop at the first time step where the condition fails, like runSimulation
+            keep = np.vectorize(condition, otypes=[bool])(times)
+            if not keep.all():
+                times = times[:np.argmin(keep)]
+
+        return self._runFrames(cache, times, 10 * cache["dT"], frameVelocities)
+
+    def _sampleTimes(self, dT, Ts, Tend, condition):
+        """Step from Ts towards Tend by dT while the condition holds."""
         times = []
-        objects = []
         currentT = Ts
-        while currentT < Tend and condition(currentT):
+        while currentT < Tend and (condition is None or condition(currentT)):
             times.append(currentT)
-            timeStepObjects = []
-            for EOM in objectEOMS:
-                currentObject = []
-                for pt in EOM:
-                    Xpos = pt[0][0] * currentT + pt[0][1]
-                    Ypos = pt[1][0] * currentT + pt[1][1]
-                    vec = [Xpos, Ypos]
-                    currentObject.append(vec)
-                timeStepObjects.append(currentObject)
-
-            for event in newEvents:
-                if np.abs(event[0] - currentT) < 0.8 * dT:
-                    timeStepObjects.append([[event[1], event[2]]])
-
-            objects.append(timeStepObjects)
             currentT = currentT + dT
+        return np.array(times)
+
+    def _snapshot(self):
+        """
+        Copy the objects and events into the arrays _runFrames works on.
+
+        Every object point becomes a pair of proper-frame events, stacked
+        into one array alongside the per-object frame velocities and events.
+
+        Returns:
+            dict: worldlines (N_pts, 2, 3), ptCounts (points per object),
+            frameVelos (N_obj, 2), events (N_events, 3) and eventVelos (N_events, 2)
+        """
+        ptCounts = [len(obj) for obj in self.objects]
+        # Allocate at the final size and fill in place rather than growing lists
+        worldlines = np.empty((sum(ptCounts), 2, 3))
+        start = 0
+        for obj, count in zip(self.objects, ptCounts):
+            worldlines[start:start + count, 0] = np.reshape(obj, (-1, 3))
+            start += count
+        worldlines[:, 1] = worldlines[:, 0]
+        worldlines[:, 1, 0] += 1
+        worldlines[:, 1, 1:] += np.repeat(np.array(self.velocieis, dtype=float),
+                                          ptCounts, axis=0)
+        return {
+            "worldlines": worldlines,
+            "ptCounts": ptCounts,
+            "frameVelos": np.array(self.frameVelocity, dtype=float).reshape(-1, 2),
+            "events": np.array(self.events, dtype=float).reshape(-1, 3),
+            "eventVelos": np.array(self.eventVelos, dtype=float).reshape(-1, 2),
+        }
+
+    def _runFrames(self, snapshot, times, eventTol, frameVelocities):
+        """
+        Sample stacked worldlines and events in each observation frame.
+
+        Args:
+            snapshot (dict): Objects and events as returned by _snapshot
+            times (numpy.ndarray): Times to sample in the observation frames
+            eventTol (float): How close to an event's time it is still drawn
+            frameVelocities (list): Velocities [vx, vy] of the observation frames
+
+        Returns:
+            list: One (times, objects) tuple per frame
+        """
+        nFrames = len(frameVelocities)
+        if nFrames == 0:
+            return []
+        ptCounts = snapshot["ptCounts"]
+        boosts = np.array([[lorentzBoostMatrix(addVelocities([0,0], velo, frameVelocity))
+                            for velo in snapshot["frameVelos"]]
+                           for frameVelocity in frameVelocities])
+        boosts = np.repeat(boosts, ptCounts, axis=1)
+        boosted = np.einsum('fpij,pkj->fpki', boosts, snapshot["worldlines"])
+
+        # x = at + b, y = ct + d through the two boosted events of every point
+        dt = boosted[..., 1, 0] - boosted[..., 0, 0]
+        slopes = (boosted[..., 1, 1:] - boosted[..., 0, 1:]) / dt[..., None]
+        intercepts = boosted[..., 0, 1:] - slopes * boosted[..., 0, :1]
+        positions = times[None, :, None, None] * slopes[:, None] + intercepts[:, None]
+
+        eventBoosts = np.array([[lorentzBoostMatrix(addVelocities([0,0], velo, frameVelocity))
+                                 for velo in snapshot["eventVelos"]]
+                                for frameVelocity in frameVelocities]).reshape(nFrames, -1, 3, 3)
+        newEvents = np.einsum('feij,ej->fei', eventBoosts, snapshot["events"])
+        visible = np.abs(newEvents[:, None, :, 0] - times[None, :, None]) < eventTol
+
+        # Hand back plain nested lists, matching the original per-point loop
+        bounds = np.concatenate([[0], np.cumsum(ptCounts)]).tolist()
+        objectSlices = list(zip(bounds[:-1], bounds[1:]))
+        results = []
+        for f in range(nFrames):
+            framePositions = positions[f].tolist()
+            frameEvents = newEvents[f, :, 1:].tolist()
+            objects = []
+            for k, step in enumerate(framePositions):
+                timeStepObjects = [step[start:end] for start, end in objectSlices]
+                for j in np.flatnonzero(visible[f, k]):
+                    timeStepObjects.append([frameEvents[j]])
+                objects.append(timeStepObjects)
+            results.append((times.tolist(), objects))
 
-        return times, objects
+        return results
@@ -5,6 +5,8 @@ This module contains functions for Lorentz transformations, velocity addition,
 and coordinate system conversions used in special relativity calculations.
 """
 
+from functools import lru_cache
+
 import numpy as np
 
 
@@ -21,6 +23,36 @@ def getGamma(Vf):
     return (1 - Vf[0] * Vf[0] - Vf[1] * Vf[1]) ** (-0.5)
 
 
+@lru_cache(maxsize=64)
+def _cachedBoostMat(bx, by):
+    """Memoize boost matrices, since demos reuse a handful of frame velocities."""
+    g = getGamma([bx, by])
+    k = g**2/(1 + g)
+    mat = np.array([
+        [g, -g * bx, -g * by],
+        [-g * bx, 1 + k * bx * bx, k * bx * by],
+        [-g * by, k * bx * by, 1 + k * by * by]
+    ])
+    mat.setflags(write=False)
+    return mat
+
+
+def lorentzBoostMatrix(V):
+    """
+    Build the Lorentz boost matrix for a frame moving at velocity V.
+    
+    Uses the closed form for an arbitrary boost direction, with
+    k = γ²/(1 + γ), acting on 4-vectors ordered [t, x, y].
+    
+    Args:
+        V (list): Velocity [vx, vy] of frame S' relative to frame S
+        
+    Returns:
+        numpy.ndarray: Read-only 3x3 boost matrix taking [t, x, y] from S to S'
+    """
+    return _cachedBoostMat(float(V[0]), float(V[1]))
+
+
 def lorentzTranformPt(fourVec, V):
     """
     Apply Lorentz transformation to a 4-vector point.
@@ -34,17 +66,8 @@ def lorentzTranformPt(fourVec, V):
     Returns:
         numpy.ndarray: Transformed 4-vector
     """
-    newFourVec = np.array(fourVec)
-    g = getGamma(V)
-    bx = V[0]
-    by = V[1]
-    g2 = g**2/(1 + g)
-    LTMat = np.array([
-        [g, -g * bx, -g * by],
-        [-g * bx, 1 + g2 * bx * bx, g2 * bx * by],
-        [-g * by, g2 * bx * by, 1 + g2 * by * by]
-    ])
-    return LTMat @ newFourVec
+    newFourVec = np.asarray(fourVec)
+    return lorentzBoostMatrix(V) @ newFourVec
 
 
 def addVelocities(objectVelo, Vf1, Vf2):
@@ -12,6 +12,8 @@ def trueCond(t):
     
     This is a simple condition function that always returns True,
     useful for running simulations without any stopping conditions.
+    Passing None as the condition has the same effect without calling
+    a function at every time step.
     
     Args:
         t (float): Current time (unused)
@@ -130,6 +130,12 @@ def RelatavisticAnimation(simulations, plotLimits, title):
         line, = ax.plot([], [], '-', marker='o')
         lines.append(line)
 
+    def init():
+        """Clear all lines so blitting starts from the static background."""
+        for line in lines:
+            line.set_data([], [])
+        return lines
+
     def update(i, AllSimulations, lines, maxObjNum):
         """Update function for animation frames."""
         currentTs = AllSimulations[i]
@@ -141,8 +147,31 @@ def RelatavisticAnimation(simulations, plotLimits, title):
                 lines[j].set_data([], [])
         return lines
 
-    ani = animation.FuncAnimation(fig, update, len(AllSimulations), 
+    # Limits are fixed above, so only the lines need redrawing each frame
+    ani = animation.FuncAnimation(fig, update, len(AllSimulations), init_func=init,
                                  fargs=[AllSimulations, lines, maxObjectNum],
                                  interval=20, blit=True, repeat=False)
     plt.close()
     return ani
+
+
+def saveGif(ani, path, fps=30, dpi=80):
+    """
+    Save an animation from RelatavisticAnimation as a gif.
+    
+    Uses the ffmpeg writer when ffmpeg is installed, since it is faster and
+    gives smaller files than pillow, and falls back to pillow otherwise.
+    For scripts without a display, call matplotlib.use("Agg") before
+    importing pyplot; Agg is the fastest non-interactive backend.
+    
+    Args:
+        ani (matplotlib.animation.FuncAnimation): Animation to save
+        path (str): Output file path, e.g. "time_dilation.gif"
+        fps (int): Frames per second (default 30)
+        dpi (int): Resolution of each frame (default 80)
+    """
+    if animation.writers.is_available('ffmpeg'):
+        writer = animation.FFMpegWriter(fps=fps)
+    else:
+        writer = animation.PillowWriter(fps=fps)
+    ani.save(path, writer=writer, dpi=dpi, savefig_kwargs={'facecolor': 'white'})
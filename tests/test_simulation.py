@@ -1,9 +1,12 @@
 """Tests for the simulation module."""
 
+import json
+
 import pytest
 import numpy as np
 from special_relativity_grapher.simulation import Simulation
-from special_relativity_grapher.utils import trueCond
+from special_relativity_grapher.transforms import getEOM
+from special_relativity_grapher.utils import trueCond, stopAtTime
 
 
 class TestSimulation:
@@ -89,6 +92,40 @@ class TestSimulation:
         assert line[0] == [t, start_pt[0], start_pt[1]]
         assert line[1] == [t, start_pt[0], start_pt[1] + length]
     
+    def test_add_lines_matches_add_line(self):
+        """Test that batched lines match repeated addLine calls."""
+        ts = np.arange(1, 4)
+        start_pts = np.stack([np.zeros_like(ts), ts], axis=1)
+
+        batched = Simulation()
+        batched.addLines(start_pts, 0.5, [1, 1], [0, 0], True, ts)
+
+        looped = Simulation()
+        for i in range(len(ts)):
+            looped.addLine([0, i + 1], 0.5, [1, 1], [0, 0], True, i + 1)
+
+        assert batched.objects == looped.objects
+        assert batched.velocieis == looped.velocieis
+        assert batched.frameVelocity == looped.frameVelocity
+
+    def test_add_lines_shared_time(self):
+        """Test batched vertical lines sharing one time coordinate."""
+        sim = Simulation()
+        sim.addLines([[0, 0], [2, 1]], 3, [0, 0], [0, 0], False, 4)
+
+        assert sim.objects[-2:] == [[[4, 0, 0], [4, 0, 3]], [[4, 2, 1], [4, 2, 4]]]
+
+    def test_add_lines_empty_batch(self):
+        """Test that an empty batch adds nothing, like an empty addLine loop."""
+        sim = Simulation()
+        initial_count = len(sim.objects)
+
+        sim.addLines([], 1, [0, 0], [0, 0], True, [])
+
+        assert len(sim.objects) == initial_count
+        assert len(sim.velocieis) == initial_count
+        assert len(sim.frameVelocity) == initial_count
+
     def test_add_train(self):
         """Test adding a train (rectangle)."""
         sim = Simulation()
@@ -224,3 +261,128 @@ class TestSimulationRun:
         
         # Results should be different (same object seen from different frames)
         # This is a basic check - detailed physics verification would need more complex assertions
+
+    def test_run_from_cache_matches_run_simulation(self):
+        """Test that the cached path reproduces runSimulation in several frames."""
+        sim = Simulation()
+        sim.addLine([0, 0], 5, [0, 0], [-0.5, 0], True, 0)
+        sim.addTrain([-1, -1], 2, 2, [0.1, 0], [0.3, 0], 0)
+        sim.addEvent([1, 5, 0], [0, 0])
+
+        sim.precomputeWorldlines(0.1, 0, 2)
+        for frame_velo in ([0, 0], [0.5, 0], [0.3, 0.4]):
+            times, objects = sim.runSimulation(frame_velo, 0.1, 0, 2, trueCond)
+            cached_times, cached_objects = sim.runSimulationFromCache(frame_velo)
+
+            np.testing.assert_allclose(cached_times, times, atol=1e-12)
+            assert len(cached_objects) == len(objects)
+            for step, cached_step in zip(objects, cached_objects):
+                assert len(cached_step) == len(step)
+                for obj, cached_obj in zip(step, cached_step):
+                    np.testing.assert_allclose(cached_obj, obj, atol=1e-8)
+
+    def test_run_from_cache_requires_precompute(self):
+        """Test that the cached path needs precomputed worldlines."""
+        sim = Simulation()
+        with pytest.raises(RuntimeError):
+            sim.runSimulationFromCache([0, 0])
+
+    def test_run_simulation_without_condition(self):
+        """Test that a None condition behaves like trueCond."""
+        sim = Simulation()
+        sim.addPt([0, 0, 0], [0.5, 0], [0, 0])
+
+        times, objects = sim.runSimulation([0.3, 0], 0.1, 0, 1, trueCond)
+        times_none, objects_none = sim.runSimulation([0.3, 0], 0.1, 0, 1)
+
+        assert times_none == times
+        np.testing.assert_allclose(np.array(objects_none), np.array(objects))
+
+    def test_run_from_cache_with_condition(self):
+        """Test that the cached path stops where the condition first fails."""
+        sim = Simulation()
+        sim.addPt([0, 0, 0], [0.5, 0], [0, 0])
+        sim.precomputeWorldlines(0.1, 0, 2)
+
+        times, objects = sim.runSimulation([0, 0], 0.1, 0, 2, stopAtTime(1))
+        cached_times, cached_objects = sim.runSimulationFromCache([0, 0], stopAtTime(1))
+
+        np.testing.assert_allclose(cached_times, times)
+        assert len(cached_objects) == len(objects)
+        for step, cached_step in zip(objects, cached_objects):
+            assert len(step) == len(cached_step)
+            for obj, cached_obj in zip(step, cached_step):
+                np.testing.assert_allclose(cached_obj, obj)
+
+    def test_run_many_from_cache_matches_single_frames(self):
+        """Test that batching frames gives the same output as one frame at a time."""
+        sim = Simulation()
+        sim.addTrain([-1, -1], 7, 2, [0, 0], [0, 0], 0)
+        sim.addEvent([1, 1, 0], [0, 0])
+        sim.addEvent([1, 5, 0], [0, 0])
+        sim.precomputeWorldlines(0.1, 0, 3)
+
+        frames = [[0, 0], [0.5, 0], [0.5, 0.5]]
+        batched = sim.runSimulationsFromCache(frames)
+
+        assert len(batched) == len(frames)
+        for frame_velo, (times, objects) in zip(frames, batched):
+            single_times, single_objects = sim.runSimulationFromCache(frame_velo)
+            assert times == single_times
+            for step, single_step in zip(objects, single_objects):
+                assert len(step) == len(single_step)
+                for obj, single_obj in zip(step, single_step):
+                    np.testing.assert_allclose(obj, single_obj)
+
+    def test_run_many_from_cache_without_frames(self):
+        """Test that an empty list of frames gives an empty list of runs."""
+        sim = Simulation()
+        sim.addPt([0, 0, 0], [0.5, 0], [0, 0])
+        sim.precomputeWorldlines(0.1, 0, 1)
+
+        assert sim.runSimulationsFromCache([]) == []
+
+    def test_run_simulation_follows_eom(self):
+        """Test that sampled positions follow each point's equations of motion."""
+        sim = Simulation()
+        sim.addTrain([-1, -1], 2, 2, [0.1, 0], [0.3, 0], 0)
+        frame_velo = [0.3, 0.4]
+
+        times, objects = sim.runSimulation(frame_velo, 0.1, 0, 1)
+
+        for i in range(len(sim.objects)):
+            eoms = getEOM(sim.objects[i], sim.velocieis[i],
+                          sim.frameVelocity[i], frame_velo)
+            for t, step in zip(times, objects):
+                expected = [[np.polyval(x_eom, t), np.polyval(y_eom, t)]
+                            for x_eom, y_eom in eoms]
+                np.testing.assert_allclose(step[i], expected, atol=1e-8)
+
+    def test_run_from_cache_ignores_later_additions(self):
+        """Test that objects and events added after precompute are not used."""
+        sim = Simulation()
+        sim.addLine([0, 0], 5, [0, 0], [-0.5, 0], True, 0)
+        sim.addEvent([1, 1, 0], [0, 0])
+        sim.precomputeWorldlines(0.1, 0, 2)
+        _, before = sim.runSimulationFromCache([0.5, 0])
+
+        sim.addTrain([-1, -1], 2, 2, [0, 0], [0.3, 0], 0)
+        sim.addEvent([1, 5, 0], [0, 0])
+        _, after = sim.runSimulationFromCache([0.5, 0])
+
+        for step, later_step in zip(before, after):
+            assert len(later_step) == len(step)
+            for obj, later_obj in zip(step, later_step):
+                np.testing.assert_allclose(later_obj, obj)
+
+    def test_run_simulation_returns_plain_lists(self):
+        """Test that simulation output stays nested Python lists."""
+        sim = Simulation()
+        sim.addEvent([0, 1, 2], [0, 0])
+
+        times, objects = sim.runSimulation([0, 0], 0.1, 0, 1)
+
+        assert isinstance(times, list)
+        assert objects[0][0] == [[0.0, 0.0]]
+        assert objects[0][1] == [[1.0, 2.0]]
+        json.dumps(objects)
@@ -3,7 +3,7 @@
 import pytest
 import numpy as np
 from special_relativity_grapher.transforms import (
-    getGamma, lorentzTranformPt, addVelocities, 
+    getGamma, lorentzTranformPt, lorentzBoostMatrix, addVelocities, 
     lorentzTransformObject, getEOM
 )
 
@@ -68,6 +68,23 @@ class TestLorentzTransform:
         # y coordinate should be unchanged
         assert abs(result[2] - 0.0) < 1e-10
 
+    def test_boost_matrix_at_rest(self):
+        """Test boost matrix is the identity for zero velocity."""
+        np.testing.assert_allclose(lorentzBoostMatrix([0, 0]), np.eye(3), atol=1e-10)
+
+    def test_boost_matrix_preserves_interval(self):
+        """Test boost matrix preserves the Minkowski metric."""
+        boost = lorentzBoostMatrix([0.3, 0.4])
+        metric = np.diag([1, -1, -1])
+        np.testing.assert_allclose(boost.T @ metric @ boost, metric, atol=1e-10)
+
+    def test_boost_matrix_is_cached(self):
+        """Test repeated frame velocities reuse one read-only matrix."""
+        first = lorentzBoostMatrix([0.8, 0])
+        second = lorentzBoostMatrix(np.array([0.8, 0.0]))
+        assert first is second
+        assert not first.flags.writeable
+
 
 class TestVelocityAddition:
     """Test relativistic velocity addition."""
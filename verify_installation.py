@@ -6,6 +6,8 @@ This script tests that the library is properly installed and can import
 all required components.
 """
 
+import sys
+
 def test_imports():
     """Test that all library components can be imported."""
     print("Testing imports...")
@@ -47,6 +49,10 @@ def test_dependencies():
     missing_packages = []
     
     for package in required_packages:
+        # The library import in test_imports already loaded these if present
+        if package in sys.modules:
+            print(f"✓ {package} available")
+            continue
         try:
             __import__(package)
             print(f"✓ {package} available")
@@ -122,6 +128,5 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
     success = main()
     sys.exit(0 if success else 1)